@@ -0,0 +1,70 @@
+"""
+Conditional GET support for read endpoints whose payload only changes when
+the underlying data does.
+
+`ConditionalGetMiddleware` tags responses with a strong ETag derived from a
+data version and the request's path and query parameters. A request whose
+If-None-Match matches the current tag is answered with 304 Not Modified
+before the endpoint (and so the database) is reached.
+"""
+import hashlib
+from typing import Callable, Iterable
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+
+
+def make_etag(version: str, path: str, query_string: bytes) -> str:
+    """Builds a strong ETag for `path` and its (order-insensitive) query parameters at `version`."""
+    query = urlencode(sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)))
+    digest = hashlib.sha1(f"{path}?{query}".encode()).hexdigest()[:16]
+    return f'"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Evaluates an If-None-Match header value against `etag` (weak comparison, per RFC 9110)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class ConditionalGetMiddleware:
+    """
+    Pure ASGI middleware adding ETags to GET/HEAD responses under `path_prefixes`
+    and answering matching If-None-Match requests with 304.
+
+    `version_provider` must return a string that changes whenever any data a
+    covered endpoint could return changes.
+    """
+
+    def __init__(self, app, version_provider: Callable[[], str], path_prefixes: Iterable[str]):
+        self.app = app
+        self.version_provider = version_provider
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or not scope["path"].startswith(self.path_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        etag = make_etag(self.version_provider(), scope["path"], scope.get("query_string", b""))
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            response = Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+            await response(scope, receive, send)
+            return
+
+        async def send_with_etag(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                headers["ETag"] = etag
+                headers["Cache-Control"] = "no-cache"
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
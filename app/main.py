@@ -1,13 +1,23 @@
 # main.py
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query, status, Body, Depends
+from fastapi import APIRouter, FastAPI, HTTPException, Query, status, Body, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, HttpUrl
-from typing import List, Optional, Annotated
+from typing import List, Literal, Optional, Annotated
 from datetime import date, datetime
 from decimal import Decimal
+import base64
+import binascii
+import csv
+import io
+import json
 import random
-from sqlalchemy.orm import Session
+import threading
+import time
+from sqlalchemy.orm import Session, joinedload, selectinload
+
+from http_caching import ConditionalGetMiddleware
 
 # --------------------------------------------------------------------------- #
 # Application Setup
@@ -18,6 +28,15 @@ app = FastAPI(
     version="1.0.0",
 )
 
+# Answer conditional GETs on read endpoints from the data version, before any
+# database work (see "Data Version"). Added before CORS so that CORS stays the
+# outermost middleware and 304 responses still carry CORS headers.
+app.add_middleware(
+    ConditionalGetMiddleware,
+    version_provider=lambda: current_data_version(),
+    path_prefixes=("/contracts", "/companies", "/locations", "/stats"),
+)
+
 # Add CORS middleware to allow requests from React frontend
 app.add_middleware(
     CORSMiddleware,
@@ -30,6 +49,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all HTTP methods
     allow_headers=["*"],  # Allow all headers
+    expose_headers=["X-Next-Cursor", "Link"],  # Pagination headers read by the frontend
 )
 
 # Create database tables on startup
@@ -140,8 +160,14 @@ from sqlalchemy import (
     Float,
     Numeric,
     ForeignKey,
+    Index,
     Table,
-    func
+    cast,
+    event,
+    func,
+    select,
+    text,
+    tuple_,
 )
 from sqlalchemy.orm import relationship, declarative_base
 
@@ -157,7 +183,9 @@ contract_naics_association = Table(
     'contract_naics',
     Base.metadata,
     Column('contract_id', Integer, ForeignKey('contracts.contract_id', onupdate="CASCADE", ondelete="CASCADE"), primary_key=True),
-    Column('naics_code', String, ForeignKey('naics_codes.naics_code', onupdate="CASCADE", ondelete="RESTRICT"), primary_key=True)
+    Column('naics_code', String, ForeignKey('naics_codes.naics_code', onupdate="CASCADE", ondelete="RESTRICT"), primary_key=True),
+    # Reverse of the PK, serves "contracts with NAICS code X" lookups
+    Index('idx_contract_naics_code_contract', 'naics_code', 'contract_id'),
 )
 
 # Association table for Contracts and PSC Codes
@@ -165,7 +193,9 @@ contract_psc_association = Table(
     'contract_psc',
     Base.metadata,
     Column('contract_id', Integer, ForeignKey('contracts.contract_id', onupdate="CASCADE", ondelete="CASCADE"), primary_key=True),
-    Column('psc_code', String, ForeignKey('psc_codes.psc_code', onupdate="CASCADE", ondelete="RESTRICT"), primary_key=True)
+    Column('psc_code', String, ForeignKey('psc_codes.psc_code', onupdate="CASCADE", ondelete="RESTRICT"), primary_key=True),
+    # Reverse of the PK, serves "contracts with PSC code X" lookups
+    Index('idx_contract_psc_code_contract', 'psc_code', 'contract_id'),
 )
 
 
@@ -325,10 +355,61 @@ class ContractModel(Base):
     # Relationship to PSC Codes (M:N)
     psc_codes = relationship("PscCodeModel", secondary=contract_psc_association, back_populates="contracts")
 
+    __table_args__ = (
+        # Keyset pagination / range filters for each sort order (see CONTRACT_SORTS)
+        Index("idx_contracts_date_awarded_id", "date_awarded", "contract_id"),
+        Index("idx_contracts_total_value_id", "total_value", "contract_id"),
+        # Company filter combined with either sort order
+        Index("idx_contracts_company_date_id", "company_id", "date_awarded", "contract_id"),
+        Index("idx_contracts_company_value_id", "company_id", "total_value", "contract_id"),
+        # Covering index for date-filtered dashboard aggregates
+        Index("idx_contracts_stats", "date_awarded", "company_id", "total_value"),
+    )
+
     def __repr__(self):
         return f"<ContractModel(contract_number='{self.contract_number}')>"
 
 
+# --------------------------------------------------------------------
+# 6. Dashboard Rollup Tables (SQLAlchemy Models)
+# --------------------------------------------------------------------
+# Per-year aggregates kept current by triggers (see "Rollup Maintenance").
+
+class CompanyYearStatsModel(Base):
+    __tablename__ = 'stats_company_year'
+    year = Column(Integer, primary_key=True)
+    company_id = Column(Integer, primary_key=True)
+    total_value = Column(Numeric, nullable=False, server_default='0')
+    total_obligated = Column(Numeric, nullable=False, server_default='0')
+    contract_count = Column(Integer, nullable=False, server_default='0')
+
+
+class NaicsYearStatsModel(Base):
+    __tablename__ = 'stats_naics_year'
+    year = Column(Integer, primary_key=True)
+    naics_code = Column(String, primary_key=True)
+    total_value = Column(Numeric, nullable=False, server_default='0')
+    total_obligated = Column(Numeric, nullable=False, server_default='0')
+    contract_count = Column(Integer, nullable=False, server_default='0')
+
+    __table_args__ = (
+        Index("idx_stats_naics_year_code", "naics_code", "year"),
+    )
+
+
+class PscYearStatsModel(Base):
+    __tablename__ = 'stats_psc_year'
+    year = Column(Integer, primary_key=True)
+    psc_code = Column(String, primary_key=True)
+    total_value = Column(Numeric, nullable=False, server_default='0')
+    total_obligated = Column(Numeric, nullable=False, server_default='0')
+    contract_count = Column(Integer, nullable=False, server_default='0')
+
+    __table_args__ = (
+        Index("idx_stats_psc_year_code", "psc_code", "year"),
+    )
+
+
 ### 2. Database Session/Dependency
 
 ###This code block provides the necessary boilerplate for connecting to the database and managing sessions within a FastAPI application.
@@ -342,21 +423,42 @@ from sqlalchemy.ext.declarative import declarative_base
 # 1. Define the database connection URL.
 #    For SQLite, it's "sqlite:///./your_database_name.db".
 #    The "./" means the file will be created in the current directory.
+#    Environment overrides:
+#      CONVISOFT_DATABASE_URL        sync URL (default: artifacts/convisoft.db)
+#      CONVISOFT_ASYNC_DATABASE_URL  async URL (default: the sync URL with its async driver)
+#      CONVISOFT_DB_MODE             "sync" (default) or "async" read endpoints
 import os
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 # Construct absolute path to database file
-db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'artifacts', 'convisoft.db')
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{db_path}"
+default_db_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'artifacts', 'convisoft.db')
+SQLALCHEMY_DATABASE_URL = os.environ.get("CONVISOFT_DATABASE_URL", f"sqlite:///{default_db_path}")
+db_url = make_url(SQLALCHEMY_DATABASE_URL)
+db_path = db_url.database if db_url.get_backend_name() == "sqlite" and db_url.database not in (None, "", ":memory:") else None
 
 # Debug: Print the database path (remove this after confirming it works)
 print(f"Database path: {db_path}")
-print(f"Database exists: {os.path.exists(db_path)}")
+print(f"Database exists: {bool(db_path) and os.path.exists(db_path)}")
+
+# Async drivers used when CONVISOFT_ASYNC_DATABASE_URL isn't given
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+def to_async_url(url) -> str:
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+ASYNC_DATABASE_URL = os.environ.get("CONVISOFT_ASYNC_DATABASE_URL", to_async_url(db_url))
+DB_MODE = os.environ.get("CONVISOFT_DB_MODE", "sync")
+if DB_MODE not in ("sync", "async"):
+    raise ValueError(f"CONVISOFT_DB_MODE must be 'sync' or 'async', got {DB_MODE!r}")
 
 # 2. Create the SQLAlchemy engine.
 #    The `connect_args` is needed only for SQLite to allow multithreading.
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False}
+    connect_args={"check_same_thread": False} if db_url.get_backend_name() == "sqlite" else {}
 )
 
 # 3. Create a SessionLocal class.
@@ -384,11 +486,477 @@ def get_db():
     finally:
         db.close()
 
+# 6. Async engine and session, used by the read endpoints when DB_MODE is "async".
+#    Writes, exports and startup DDL always use the sync engine above.
+async_engine = create_async_engine(ASYNC_DATABASE_URL) if DB_MODE == "async" else None
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False) if async_engine else None
+
+async def get_async_db():
+    """
+    FastAPI dependency that provides an async database session for a request.
+    Yields:
+        AsyncSession: The SQLAlchemy async session.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+# --------------------------------------------------------------------------- #
+# Data Version
+# --------------------------------------------------------------------------- #
+# A counter bumped after every committed write, used to build ETags for the
+# read endpoints. It starts from the wall clock so versions keep increasing
+# across restarts; writes made by other processes (e.g. CLI imports) are
+# caught by also folding in the database file's modification stamp.
+_data_version = time.time_ns()
+_data_version_lock = threading.Lock()
+
+def bump_data_version():
+    """Marks all cached read responses as stale."""
+    global _data_version
+    with _data_version_lock:
+        _data_version += 1
+
+def _database_file_stamp() -> int:
+    stamp = 0
+    if db_path is None:
+        return stamp
+    for path in (db_path, db_path + "-wal"):
+        try:
+            stamp = max(stamp, os.stat(path).st_mtime_ns)
+        except OSError:
+            pass
+    return stamp
+
+def current_data_version() -> str:
+    return f"{_data_version:x}.{_database_file_stamp():x}"
+
+def mark_session_dirty(session: Session):
+    """Records that `session` wrote data, so its next commit bumps the data version."""
+    session.info["data_changed"] = True
+
+@event.listens_for(Session, "after_flush")
+def _flag_orm_writes(session, flush_context):
+    mark_session_dirty(session)
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_dml_statements(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mark_session_dirty(orm_execute_state.session)
+
+@event.listens_for(Session, "after_commit")
+def _bump_on_commit(session):
+    if session.info.pop("data_changed", False):
+        bump_data_version()
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_writes(session):
+    session.info.pop("data_changed", None)
+
 # Optional: A function to create all tables in the database.
 # You would call this once when your application starts up.
 def create_database_tables():
     """Creates all tables defined in the Base metadata."""
     Base.metadata.create_all(bind=engine)
+    create_missing_indexes(engine)
+
+def create_missing_indexes(bind):
+    """
+    Creates indexes declared on the models that an existing database lacks.
+    `create_all` only emits indexes together with a new table, so databases
+    created before an index was added to a model would never receive it.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
+# --------------------------------------------------------------------------- #
+# Rollup Maintenance
+# --------------------------------------------------------------------------- #
+# The stats_* tables are maintained by SQLite triggers, so every writer --
+# create_contract, bulk loads, raw SQL scripts -- updates them in the same
+# transaction as the contract rows. `rebuild_rollups` recomputes them from
+# scratch (`python manage.py rebuild-rollups`).
+
+ROLLUP_TABLES = ("stats_company_year", "stats_naics_year", "stats_psc_year")
+
+def _award_year(row: str) -> str:
+    return f"CAST(substr({row}.date_awarded, 1, 4) AS INTEGER)"
+
+def _rollup_add(table: str, key: str, select_sql: str) -> str:
+    """INSERT ... ON CONFLICT statement adding the rows of `select_sql` to a rollup."""
+    return f"""INSERT INTO {table} (year, {key}, total_value, total_obligated, contract_count)
+        {select_sql}
+        ON CONFLICT (year, {key}) DO UPDATE SET
+            total_value = total_value + excluded.total_value,
+            total_obligated = total_obligated + excluded.total_obligated,
+            contract_count = contract_count + excluded.contract_count;"""
+
+def _rollup_subtract(table: str, row: str, key_predicate: str) -> str:
+    """Statements removing contract `row` from the rollup groups matching `key_predicate`."""
+    group = f"year = {_award_year(row)} AND {key_predicate}"
+    return f"""UPDATE {table} SET
+            total_value = total_value - {row}.total_value,
+            total_obligated = total_obligated - COALESCE({row}.total_obligated, 0),
+            contract_count = contract_count - 1
+        WHERE {group};
+        DELETE FROM {table} WHERE {group} AND contract_count <= 0;"""
+
+def _company_rollup_triggers() -> dict:
+    table = "stats_company_year"
+    add = _rollup_add(table, "company_id", f"""SELECT {_award_year('NEW')}, NEW.company_id, NEW.total_value, COALESCE(NEW.total_obligated, 0), 1 WHERE true""")
+    subtract = _rollup_subtract(table, "OLD", "company_id = OLD.company_id")
+    return {
+        "trg_contracts_company_stats_insert": ("AFTER INSERT ON contracts", add),
+        "trg_contracts_company_stats_delete": ("AFTER DELETE ON contracts", subtract),
+        "trg_contracts_company_stats_update": (
+            "AFTER UPDATE OF date_awarded, company_id, total_value, total_obligated ON contracts",
+            subtract + "\n        " + add,
+        ),
+    }
+
+def _code_rollup_triggers(code: str) -> dict:
+    """Triggers keeping stats_<code>_year in step with contract_<code> and contracts."""
+    table, junction, key = f"stats_{code}_year", f"contract_{code}", f"{code}_code"
+    add_link = _rollup_add(table, key, f"""SELECT {_award_year('c')}, NEW.{key}, c.total_value, COALESCE(c.total_obligated, 0), 1
+        FROM contracts c WHERE c.contract_id = NEW.contract_id""")
+    # Deleting a contract cascades to its junction rows only after the contract
+    # row is gone, so this finds no contract then; the contracts delete trigger
+    # subtracts for every linked code instead.
+    subtract_link = f"""UPDATE {table} SET
+            total_value = {table}.total_value - c.total_value,
+            total_obligated = {table}.total_obligated - COALESCE(c.total_obligated, 0),
+            contract_count = {table}.contract_count - 1
+        FROM contracts c
+        WHERE c.contract_id = OLD.contract_id AND {table}.year = {_award_year('c')} AND {table}.{key} = OLD.{key};
+        DELETE FROM {table} WHERE {key} = OLD.{key} AND contract_count <= 0;"""
+    linked = f"{key} IN (SELECT {key} FROM {junction} WHERE contract_id = OLD.contract_id)"
+    subtract_contract = _rollup_subtract(table, "OLD", linked)
+    add_contract = _rollup_add(table, key, f"""SELECT {_award_year('NEW')}, {key}, NEW.total_value, COALESCE(NEW.total_obligated, 0), 1
+        FROM {junction} WHERE contract_id = NEW.contract_id""")
+    return {
+        f"trg_{junction}_stats_insert": (f"AFTER INSERT ON {junction}", add_link),
+        f"trg_{junction}_stats_delete": (f"AFTER DELETE ON {junction}", subtract_link),
+        f"trg_{junction}_stats_update": (f"AFTER UPDATE ON {junction}", subtract_link + "\n        " + add_link),
+        f"trg_contracts_{code}_stats_delete": ("BEFORE DELETE ON contracts", subtract_contract),
+        f"trg_contracts_{code}_stats_update": (
+            "AFTER UPDATE OF date_awarded, total_value, total_obligated ON contracts",
+            subtract_contract + "\n        " + add_contract,
+        ),
+    }
+
+def rollup_triggers() -> dict:
+    """Trigger name -> CREATE TRIGGER statement for every rollup-maintaining trigger."""
+    triggers = {**_company_rollup_triggers(), **_code_rollup_triggers("naics"), **_code_rollup_triggers("psc")}
+    return {
+        name: f"CREATE TRIGGER IF NOT EXISTS {name} {timing} BEGIN\n        {body}\n    END"
+        for name, (timing, body) in triggers.items()
+    }
+
+def rebuild_rollups(conn):
+    """Recomputes every rollup table from contracts and the junction tables."""
+    conn.execute(text("DELETE FROM stats_company_year"))
+    conn.execute(text(f"""
+        INSERT INTO stats_company_year (year, company_id, total_value, total_obligated, contract_count)
+        SELECT {_award_year('c')}, c.company_id, SUM(c.total_value), SUM(COALESCE(c.total_obligated, 0)), COUNT(*)
+        FROM contracts c GROUP BY 1, 2
+    """))
+    for code in ("naics", "psc"):
+        conn.execute(text(f"DELETE FROM stats_{code}_year"))
+        conn.execute(text(f"""
+            INSERT INTO stats_{code}_year (year, {code}_code, total_value, total_obligated, contract_count)
+            SELECT {_award_year('c')}, j.{code}_code, SUM(c.total_value), SUM(COALESCE(c.total_obligated, 0)), COUNT(*)
+            FROM contract_{code} j JOIN contracts c ON c.contract_id = j.contract_id
+            GROUP BY 1, 2
+        """))
+
+def _mark_rollups_created(table, connection, **kw):
+    connection.info["rollups_created"] = True
+
+for _rollup_table in ROLLUP_TABLES:
+    event.listen(Base.metadata.tables[_rollup_table], "after_create", _mark_rollups_created)
+
+@event.listens_for(Base.metadata, "after_create")
+def _install_rollup_triggers(target, connection, **kw):
+    """Installs the rollup triggers and backfills rollup tables created on an existing database."""
+    if connection.dialect.name != "sqlite":
+        return
+    for ddl in rollup_triggers().values():
+        connection.execute(text(ddl))
+    if connection.info.pop("rollups_created", False):
+        rebuild_rollups(connection)
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_rollup_triggers(target, connection, **kw):
+    if connection.dialect.name != "sqlite":
+        return
+    for name in rollup_triggers():
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+
+
+# --------------------------------------------------------------------------- #
+# Pagination Helpers
+# --------------------------------------------------------------------------- #
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(values: list) -> str:
+    """Encodes the sort key of the last row on a page as an opaque cursor."""
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> list:
+    """Decodes a cursor produced by `encode_cursor`, rejecting anything else with a 400."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        values = None
+    if not isinstance(values, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor.")
+    return values
+
+def set_next_page_headers(request: Request, response: Response, next_cursor: Optional[str]):
+    """Advertises the next page through `X-Next-Cursor` and an RFC 8288 `Link` header."""
+    if next_cursor is None:
+        return
+    response.headers["X-Next-Cursor"] = next_cursor
+    next_url = request.url.include_query_params(cursor=next_cursor)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+
+
+# --------------------------------------------------------------------------- #
+# Contract Filter & Sort Helpers
+# --------------------------------------------------------------------------- #
+ContractSort = Literal["-date_awarded", "date_awarded", "-total_value", "total_value"]
+
+# Sort key -> (column, descending). contract_id breaks ties in the same direction.
+CONTRACT_SORTS = {
+    "-date_awarded": (ContractModel.date_awarded, True),
+    "date_awarded": (ContractModel.date_awarded, False),
+    "-total_value": (ContractModel.total_value, True),
+    "total_value": (ContractModel.total_value, False),
+}
+
+class ContractFilters(BaseModel):
+    """Filters shared by every endpoint that selects contracts."""
+    min_date: Optional[date] = None
+    max_date: Optional[date] = None
+    min_value: Optional[Decimal] = None
+    max_value: Optional[Decimal] = None
+    naics_code: Optional[str] = None
+    psc_code: Optional[str] = None
+    company_id: Optional[int] = None
+
+def contract_filters(
+    min_date: Annotated[Optional[date], Query(description="Filter by minimum award date (YYYY-MM-DD)")] = None,
+    max_date: Annotated[Optional[date], Query(description="Filter by maximum award date (YYYY-MM-DD)")] = None,
+    min_value: Annotated[Optional[Decimal], Query(description="Filter by minimum total contract value", gt=0)] = None,
+    max_value: Annotated[Optional[Decimal], Query(description="Filter by maximum total contract value", gt=0)] = None,
+    naics_code: Annotated[Optional[str], Query(description="Filter by a specific NAICS code")] = None,
+    psc_code: Annotated[Optional[str], Query(description="Filter by a specific PSC code")] = None,
+    company_id: Annotated[Optional[int], Query(description="Filter by a specific company ID")] = None,
+) -> ContractFilters:
+    """FastAPI dependency collecting the contract filter query parameters."""
+    return ContractFilters(
+        min_date=min_date, max_date=max_date,
+        min_value=min_value, max_value=max_value,
+        naics_code=naics_code, psc_code=psc_code,
+        company_id=company_id,
+    )
+
+class ContractPage(BaseModel):
+    """Ordering, pagination and expansion options of a contract listing."""
+    sort: str = "-date_awarded"
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
+    expand: set = set()
+
+def contract_page(
+    sort: Annotated[ContractSort, Query(description="Sort key; prefix with '-' for descending")] = "-date_awarded",
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of contracts to return")] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[Optional[str], Query(description="Opaque cursor taken from the X-Next-Cursor header of the previous page")] = None,
+    expand: Annotated[Optional[str], Query(description="Comma-separated related data to embed: company, location, codes")] = None,
+) -> ContractPage:
+    """FastAPI dependency collecting the contract listing's paging parameters."""
+    return ContractPage(sort=sort, limit=limit, cursor=cursor, expand=parse_expand(expand))
+
+def stats_filters(
+    min_date: Annotated[Optional[date], Query(description="Only include contracts awarded on or after this date (YYYY-MM-DD)")] = None,
+    max_date: Annotated[Optional[date], Query(description="Only include contracts awarded on or before this date (YYYY-MM-DD)")] = None,
+    naics_code: Annotated[Optional[str], Query(description="Only include contracts with this NAICS code")] = None,
+    psc_code: Annotated[Optional[str], Query(description="Only include contracts with this PSC code")] = None,
+) -> ContractFilters:
+    """FastAPI dependency collecting the filters supported by the dashboard stats."""
+    return ContractFilters(min_date=min_date, max_date=max_date, naics_code=naics_code, psc_code=psc_code)
+
+def rollup_year_bounds(filters: ContractFilters) -> Optional[tuple]:
+    """
+    Returns the (first, last) award years selected by the date filters, or None
+    when a bound falls inside a year and so can't be answered from a yearly rollup.
+    """
+    if filters.min_date is not None and (filters.min_date.month, filters.min_date.day) != (1, 1):
+        return None
+    if filters.max_date is not None and (filters.max_date.month, filters.max_date.day) != (12, 31):
+        return None
+    return (
+        filters.min_date.year if filters.min_date else None,
+        filters.max_date.year if filters.max_date else None,
+    )
+
+def apply_year_bounds(stmt, year_column, bounds: tuple):
+    first, last = bounds
+    if first is not None:
+        stmt = stmt.where(year_column >= first)
+    if last is not None:
+        stmt = stmt.where(year_column <= last)
+    return stmt
+
+def apply_contract_filters(stmt, filters: ContractFilters):
+    """
+    Adds the WHERE clauses for `filters` to a statement selecting from contracts.
+    Code filters become semi-joins on the junction tables so they are answered
+    from the (code, contract_id) indexes instead of scanning contracts.
+    """
+    if filters.min_date is not None:
+        stmt = stmt.where(ContractModel.date_awarded >= filters.min_date.isoformat())
+    if filters.max_date is not None:
+        stmt = stmt.where(ContractModel.date_awarded <= filters.max_date.isoformat())
+    if filters.min_value is not None:
+        stmt = stmt.where(ContractModel.total_value >= filters.min_value)
+    if filters.max_value is not None:
+        stmt = stmt.where(ContractModel.total_value <= filters.max_value)
+    if filters.company_id is not None:
+        stmt = stmt.where(ContractModel.company_id == filters.company_id)
+    if filters.naics_code is not None:
+        stmt = stmt.where(ContractModel.contract_id.in_(
+            select(contract_naics_association.c.contract_id)
+            .where(contract_naics_association.c.naics_code == filters.naics_code)
+        ))
+    if filters.psc_code is not None:
+        stmt = stmt.where(ContractModel.contract_id.in_(
+            select(contract_psc_association.c.contract_id)
+            .where(contract_psc_association.c.psc_code == filters.psc_code)
+        ))
+    return stmt
+
+def apply_contract_sort(stmt, sort: str, cursor: Optional[str]):
+    """
+    Orders a contract statement by `sort` and, given a cursor, seeks past the
+    last row of the previous page. Cursors carry their sort key so a cursor
+    from one ordering can't be replayed against another.
+    """
+    column, descending = CONTRACT_SORTS[sort]
+    if descending:
+        stmt = stmt.order_by(column.desc(), ContractModel.contract_id.desc())
+    else:
+        stmt = stmt.order_by(column.asc(), ContractModel.contract_id.asc())
+
+    if cursor is not None:
+        values = decode_cursor(cursor)
+        if len(values) != 3 or values[0] != sort:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor.")
+        key = tuple_(column, ContractModel.contract_id)
+        stmt = stmt.where(key < tuple_(*values[1:]) if descending else key > tuple_(*values[1:]))
+    return stmt
+
+def contract_cursor(sort: str, contract: "ContractModel") -> str:
+    """Builds the cursor pointing just past `contract` in `sort` order."""
+    column, _ = CONTRACT_SORTS[sort]
+    value = getattr(contract, column.key)
+    if isinstance(value, Decimal):
+        value = float(value)
+    return encode_cursor([sort, value, contract.contract_id])
+
+
+# --------------------------------------------------------------------------- #
+# Related-Row Loading & Serialization Helpers
+# --------------------------------------------------------------------------- #
+CONTRACT_EXPANSIONS = ("company", "location", "codes")
+
+def parse_expand(expand: Optional[str]) -> set:
+    """Parses a comma-separated `expand` parameter into a set of CONTRACT_EXPANSIONS."""
+    if not expand:
+        return set()
+    requested = {part.strip() for part in expand.split(",") if part.strip()}
+    unknown = requested - set(CONTRACT_EXPANSIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown expand value(s): {', '.join(sorted(unknown))}. Allowed: {', '.join(CONTRACT_EXPANSIONS)}.",
+        )
+    return requested
+
+def contract_load_options(expand: set) -> list:
+    """
+    Loader options that fetch the requested related rows in a fixed number of
+    queries, however many contracts are selected. Many-to-one rows are joined
+    into the main query; the code collections are each fetched with one
+    SELECT ... WHERE contract_id IN (...) batch.
+    """
+    options = []
+    if "company" in expand:
+        options.append(joinedload(ContractModel.company).joinedload(CompanyModel.primary_location))
+    if "location" in expand:
+        options.append(joinedload(ContractModel.place_of_performance))
+    if "codes" in expand:
+        options.append(selectinload(ContractModel.naics_codes))
+        options.append(selectinload(ContractModel.psc_codes))
+    return options
+
+def location_to_dict(l: Optional["LocationModel"]) -> Optional[dict]:
+    if l is None:
+        return None
+    return {
+        "location_id": l.location_id,
+        "address_line1": l.address_line1,
+        "address_line2": l.address_line2,
+        "city": l.city,
+        "state_province": l.state_province,
+        "postal_code": l.postal_code,
+        "country_code": l.country_code,
+        "latitude": l.latitude,
+        "longitude": l.longitude,
+    }
+
+def company_to_dict(c: "CompanyModel", with_location: bool = False) -> dict:
+    data = {
+        "company_id": c.company_id, 
+        "legal_name": c.legal_name,
+        "duns_number": c.duns_number,
+        "cage_code": c.cage_code,
+        "website_url": c.website_url,
+        "founded_date": c.founded_date,
+        "primary_location_id": c.primary_location_id,
+        "created_at": c.created_at,
+        "updated_at": c.updated_at
+    }
+    if with_location:
+        data["primary_location"] = location_to_dict(c.primary_location)
+    return data
+
+def contract_to_dict(c: "ContractModel", expand: set = frozenset()) -> dict:
+    """Serializes a contract, adding the related objects named in `expand` (already loaded)."""
+    data = {
+        "contract_id": c.contract_id, 
+        "contract_number": c.contract_number, 
+        "title": c.title,
+        "company_id": c.company_id,
+        "total_value": float(c.total_value) if c.total_value else 0,
+        "date_awarded": c.date_awarded,
+        "place_of_performance_location_id": c.place_of_performance_location_id,
+        "start_date": c.start_date,
+        "end_date": c.end_date,
+        "description": c.description,
+        "total_obligated": float(c.total_obligated) if c.total_obligated else None
+    }
+    if "company" in expand:
+        data["company"] = company_to_dict(c.company, with_location=True)
+    if "location" in expand:
+        data["place_of_performance"] = location_to_dict(c.place_of_performance)
+    if "codes" in expand:
+        data["naics_codes"] = [{"naics_code": n.naics_code, "description": n.description} for n in c.naics_codes]
+        data["psc_codes"] = [{"psc_code": p.psc_code, "description": p.description} for p in c.psc_codes]
+    return data
 
 
 
@@ -471,24 +1039,66 @@ def delete_user(user_id: int, db_session: Session = Depends(get_db)):
     
     return None
 
+# --- Read Endpoints: sync & async variants ---
+# Each read endpoint's query logic lives in a `fetch_*` function taking a sync
+# Session. It is served twice: on `sync_read_router` with the blocking session
+# (run in the threadpool), and on `async_read_router` through
+# `AsyncSession.run_sync`, which drives the same code over the async driver
+# without holding a thread. DB_MODE selects the router mounted at the end of
+# this module.
+sync_read_router = APIRouter()
+async_read_router = APIRouter()
+
+def fetch_contract_page(db_session: Session, filters: ContractFilters, page: ContractPage) -> tuple:
+    """Returns one page of serialized contracts and the cursor for the next page (or None)."""
+    stmt = apply_contract_filters(select(ContractModel), filters)
+    stmt = apply_contract_sort(stmt, page.sort, page.cursor).options(*contract_load_options(page.expand))
+
+    # Fetch one extra row to learn whether another page exists
+    contracts = db_session.scalars(stmt.limit(page.limit + 1)).all()
+    next_cursor = None
+    if len(contracts) > page.limit:
+        contracts = contracts[:page.limit]
+        next_cursor = contract_cursor(page.sort, contracts[-1])
+    return [contract_to_dict(c, page.expand) for c in contracts], next_cursor
+
 # --- Simple Contract Endpoints (SQLAlchemy Ready) ---
-@app.get("/contracts/", response_model=List[dict], tags=["Contracts"])
-def list_contracts(db_session: Session = Depends(get_db)):
-    """List all contracts using SQLAlchemy."""
-    contracts = db_session.query(ContractModel).all()
-    return [{
-        "contract_id": c.contract_id, 
-        "contract_number": c.contract_number, 
-        "title": c.title,
-        "company_id": c.company_id,
-        "total_value": float(c.total_value) if c.total_value else 0,
-        "date_awarded": c.date_awarded,
-        "place_of_performance_location_id": c.place_of_performance_location_id,
-        "start_date": c.start_date,
-        "end_date": c.end_date,
-        "description": c.description,
-        "total_obligated": float(c.total_obligated) if c.total_obligated else None
-    } for c in contracts]
+@sync_read_router.get("/contracts/", response_model=List[dict], tags=["Contracts"])
+def list_contracts(
+    request: Request,
+    response: Response,
+    filters: ContractFilters = Depends(contract_filters),
+    page: ContractPage = Depends(contract_page),
+    db_session: Session = Depends(get_db),
+):
+    """
+    (User Story 1) List and filter contracts by date, value, NAICS/PSC code and company.
+
+    Filtering and ordering run in SQL. Results are paginated with a keyset on
+    (sort key, contract_id): each page seeks directly past the last row of the
+    previous one, so deep pages cost the same as the first. The cursor for the
+    next page is returned in the `X-Next-Cursor` header (and a `Link: rel="next"`
+    header); it is absent on the last page. An empty page is returned as `[]`.
+
+    `expand` embeds related rows using batched loading, so a page costs at most
+    three queries regardless of its size.
+    """
+    items, next_cursor = fetch_contract_page(db_session, filters, page)
+    set_next_page_headers(request, response, next_cursor)
+    return items
+
+@async_read_router.get("/contracts/", response_model=List[dict], tags=["Contracts"])
+async def list_contracts_async(
+    request: Request,
+    response: Response,
+    filters: ContractFilters = Depends(contract_filters),
+    page: ContractPage = Depends(contract_page),
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    """(User Story 1) List and filter contracts; async variant of `list_contracts`."""
+    items, next_cursor = await db_session.run_sync(fetch_contract_page, filters, page)
+    set_next_page_headers(request, response, next_cursor)
+    return items
 
 @app.post("/contracts/", response_model=dict, status_code=status.HTTP_201_CREATED, tags=["Contracts"])
 def create_contract(
@@ -520,22 +1130,144 @@ def create_contract(
     
     return {"contract_id": db_contract.contract_id, "contract_number": db_contract.contract_number, "title": db_contract.title}
 
+# --- Contract Export (User Story 4) ---
+EXPORT_BATCH_SIZE = 2000
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+def export_columns() -> list:
+    """Flat columns written by the export, including the company name and ';'-joined codes."""
+    naics = (
+        select(func.group_concat(contract_naics_association.c.naics_code, ";"))
+        .where(contract_naics_association.c.contract_id == ContractModel.contract_id)
+        .scalar_subquery()
+    )
+    psc = (
+        select(func.group_concat(contract_psc_association.c.psc_code, ";"))
+        .where(contract_psc_association.c.contract_id == ContractModel.contract_id)
+        .scalar_subquery()
+    )
+    return [
+        ContractModel.contract_id,
+        ContractModel.contract_number,
+        ContractModel.title,
+        ContractModel.description,
+        ContractModel.company_id,
+        CompanyModel.legal_name.label("company_name"),
+        ContractModel.place_of_performance_location_id,
+        ContractModel.date_awarded,
+        ContractModel.start_date,
+        ContractModel.end_date,
+        ContractModel.total_value,
+        ContractModel.total_obligated,
+        naics.label("naics_codes"),
+        psc.label("psc_codes"),
+    ]
+
+def stream_export_batches(db_session: Session, stmt):
+    """
+    Yields lists of rows from `stmt` using a streaming cursor, so only one
+    batch of EXPORT_BATCH_SIZE rows is held in memory at a time.
+    """
+    result = db_session.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    try:
+        for partition in result.partitions():
+            yield partition
+    finally:
+        result.close()
+
+def csv_export(columns: list, batches):
+    """Encodes row batches as CSV, sending the header before the first row is read."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue()
+
+def ndjson_export(columns: list, batches):
+    """Encodes row batches as newline-delimited JSON objects."""
+    for batch in batches:
+        yield "".join(
+            json.dumps({
+                name: float(value) if isinstance(value, Decimal) else value
+                for name, value in zip(columns, row)
+            }) + "\n"
+            for row in batch
+        )
+
+@app.get("/contracts/export", tags=["Contracts"])
+def export_contracts(
+    filters: ContractFilters = Depends(contract_filters),
+    sort: Annotated[ContractSort, Query(description="Sort key; prefix with '-' for descending")] = "-date_awarded",
+    format: Annotated[Literal["csv", "ndjson"], Query(description="Export file format")] = "csv",
+    db_session: Session = Depends(get_db),
+):
+    """
+    (User Story 4) Export every contract matching the list filters as CSV or NDJSON.
+
+    Rows are streamed from a server-side cursor in batches, so memory stays flat
+    regardless of how many contracts match and the first bytes go out as soon
+    as the query starts returning rows.
+    """
+    columns = export_columns()
+    stmt = select(*columns).join(CompanyModel, CompanyModel.company_id == ContractModel.company_id)
+    stmt = apply_contract_sort(apply_contract_filters(stmt, filters), sort, None)
+    names = [column.key for column in columns]
+
+    batches = stream_export_batches(db_session, stmt)
+    body = csv_export(names, batches) if format == "csv" else ndjson_export(names, batches)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="contracts.{format}"'},
+    )
+
+def fetch_contract_detail(db_session: Session, contract_id: int) -> Optional[dict]:
+    expansions = set(CONTRACT_EXPANSIONS)
+    stmt = select(ContractModel).where(ContractModel.contract_id == contract_id).options(*contract_load_options(expansions))
+    contract = db_session.scalars(stmt).unique().first()
+    return contract_to_dict(contract, expansions) if contract else None
+
+@sync_read_router.get("/contracts/{contract_id}", response_model=dict, tags=["Contracts"])
+def get_contract(contract_id: int, db_session: Session = Depends(get_db)):
+    """
+    (User Story 5) Retrieve a single contract with its company (and the company's
+    primary location), place of performance, and NAICS/PSC codes.
+    """
+    contract = fetch_contract_detail(db_session, contract_id)
+    if not contract:
+        raise HTTPException(status_code=404, detail="Contract not found")
+    return contract
+
+@async_read_router.get("/contracts/{contract_id}", response_model=dict, tags=["Contracts"])
+async def get_contract_async(contract_id: int, db_session: AsyncSession = Depends(get_async_db)):
+    """(User Story 5) Retrieve a single contract; async variant of `get_contract`."""
+    contract = await db_session.run_sync(fetch_contract_detail, contract_id)
+    if not contract:
+        raise HTTPException(status_code=404, detail="Contract not found")
+    return contract
+
 # --- Simple Company Endpoints (SQLAlchemy Ready) ---
-@app.get("/companies/", response_model=List[dict], tags=["Companies"])
+def fetch_companies(db_session: Session) -> list:
+    companies = db_session.query(CompanyModel).all()
+    return [company_to_dict(c) for c in companies]
+
+@sync_read_router.get("/companies/", response_model=List[dict], tags=["Companies"])
 def list_companies(db_session: Session = Depends(get_db)):
     """List all companies using SQLAlchemy."""
-    companies = db_session.query(CompanyModel).all()
-    return [{
-        "company_id": c.company_id, 
-        "legal_name": c.legal_name,
-        "duns_number": c.duns_number,
-        "cage_code": c.cage_code,
-        "website_url": c.website_url,
-        "founded_date": c.founded_date,
-        "primary_location_id": c.primary_location_id,
-        "created_at": c.created_at,
-        "updated_at": c.updated_at
-    } for c in companies]
+    return fetch_companies(db_session)
+
+@async_read_router.get("/companies/", response_model=List[dict], tags=["Companies"])
+async def list_companies_async(db_session: AsyncSession = Depends(get_async_db)):
+    """List all companies; async variant of `list_companies`."""
+    return await db_session.run_sync(fetch_companies)
 
 @app.post("/companies/", response_model=dict, status_code=status.HTTP_201_CREATED, tags=["Companies"])
 def create_company(legal_name: str, db_session: Session = Depends(get_db)):
@@ -549,8 +1281,144 @@ def create_company(legal_name: str, db_session: Session = Depends(get_db)):
     return {"company_id": db_company.company_id, "legal_name": db_company.legal_name}
 
 # --- Simple Location Endpoints (SQLAlchemy Ready) ---
-@app.get("/locations/", response_model=List[dict], tags=["Locations"])
-def list_locations(db_session: Session = Depends(get_db)):
-    """List all locations using SQLAlchemy."""
+def fetch_locations(db_session: Session) -> list:
     locations = db_session.query(LocationModel).all()
     return [{"location_id": l.location_id, "city": l.city, "state_province": l.state_province} for l in locations]
+
+@sync_read_router.get("/locations/", response_model=List[dict], tags=["Locations"])
+def list_locations(db_session: Session = Depends(get_db)):
+    """List all locations using SQLAlchemy."""
+    return fetch_locations(db_session)
+
+@async_read_router.get("/locations/", response_model=List[dict], tags=["Locations"])
+async def list_locations_async(db_session: AsyncSession = Depends(get_async_db)):
+    """List all locations; async variant of `list_locations`."""
+    return await db_session.run_sync(fetch_locations)
+
+
+# --- Dashboard & Stats Endpoints (SQLAlchemy) ---
+TopCompaniesLimit = Annotated[int, Query(ge=1, le=100, description="Number of companies to return")]
+
+def fetch_top_companies(db_session: Session, limit: int, filters: ContractFilters) -> list:
+    """
+    Aggregation, ranking and the company lookup happen in a single GROUP BY
+    query; only `limit` rows come back from the database. Unless a NAICS/PSC
+    filter or a date bound inside a year is given, the totals come from the
+    per-(year, company) rollup, so the cost is independent of the contract count.
+    """
+    bounds = rollup_year_bounds(filters)
+    if bounds is not None and filters.naics_code is None and filters.psc_code is None:
+        rollup = CompanyYearStatsModel
+        totals = apply_year_bounds(
+            select(
+                rollup.company_id,
+                func.sum(rollup.total_value).label("total_contract_value"),
+                func.sum(rollup.contract_count).label("contract_count"),
+            ).group_by(rollup.company_id),
+            rollup.year,
+            bounds,
+        ).subquery()
+    else:
+        totals = apply_contract_filters(
+            select(
+                ContractModel.company_id,
+                func.sum(ContractModel.total_value).label("total_contract_value"),
+                func.count().label("contract_count"),
+            ).group_by(ContractModel.company_id),
+            filters,
+        ).subquery()
+    stmt = (
+        select(CompanyModel, totals.c.total_contract_value, totals.c.contract_count)
+        .join(totals, totals.c.company_id == CompanyModel.company_id)
+        .options(joinedload(CompanyModel.primary_location))
+        .order_by(totals.c.total_contract_value.desc(), CompanyModel.company_id)
+        .limit(limit)
+    )
+    return [
+        {
+            "company": company_to_dict(company, with_location=True),
+            "total_contract_value": float(total or 0),
+            "contract_count": count,
+        }
+        for company, total, count in db_session.execute(stmt)
+    ]
+
+@sync_read_router.get("/stats/top-companies", response_model=List[dict], tags=["Dashboard & Stats"])
+def get_top_companies(
+    limit: TopCompaniesLimit = 5,
+    filters: ContractFilters = Depends(stats_filters),
+    db_session: Session = Depends(get_db),
+):
+    """(User Story 3) Get the top companies by total contract value."""
+    return fetch_top_companies(db_session, limit, filters)
+
+@async_read_router.get("/stats/top-companies", response_model=List[dict], tags=["Dashboard & Stats"])
+async def get_top_companies_async(
+    limit: TopCompaniesLimit = 5,
+    filters: ContractFilters = Depends(stats_filters),
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    """(User Story 3) Get the top companies by total contract value; async variant."""
+    return await db_session.run_sync(fetch_top_companies, limit, filters)
+
+def fetch_value_by_year(db_session: Session, filters: ContractFilters) -> list:
+    """
+    Served from the rollup tables unless both code filters or a date bound
+    inside a year are given.
+    """
+    bounds = rollup_year_bounds(filters)
+    rollup, code_filter = None, None
+    if bounds is not None:
+        if filters.naics_code is None and filters.psc_code is None:
+            rollup = CompanyYearStatsModel
+        elif filters.psc_code is None:
+            rollup, code_filter = NaicsYearStatsModel, NaicsYearStatsModel.naics_code == filters.naics_code
+        elif filters.naics_code is None:
+            rollup, code_filter = PscYearStatsModel, PscYearStatsModel.psc_code == filters.psc_code
+
+    if rollup is not None:
+        stmt = (
+            select(rollup.year, func.sum(rollup.total_value), func.sum(rollup.contract_count))
+            .group_by(rollup.year)
+            .order_by(rollup.year.desc())
+        )
+        if code_filter is not None:
+            stmt = stmt.where(code_filter)
+        stmt = apply_year_bounds(stmt, rollup.year, bounds)
+    else:
+        year = cast(func.substr(ContractModel.date_awarded, 1, 4), Integer).label("year")
+        stmt = apply_contract_filters(
+            select(year, func.sum(ContractModel.total_value), func.count())
+            .group_by(year)
+            .order_by(year.desc()),
+            filters,
+        )
+    return [
+        {"year": y, "total_value": float(total or 0), "contract_count": count}
+        for y, total, count in db_session.execute(stmt)
+    ]
+
+@sync_read_router.get("/stats/value-by-year", response_model=List[dict], tags=["Dashboard & Stats"])
+def get_value_by_year(
+    filters: ContractFilters = Depends(stats_filters),
+    db_session: Session = Depends(get_db),
+):
+    """
+    (User Story 3) Get total contract value and count grouped by award year,
+    most recent year first.
+    """
+    return fetch_value_by_year(db_session, filters)
+
+@async_read_router.get("/stats/value-by-year", response_model=List[dict], tags=["Dashboard & Stats"])
+async def get_value_by_year_async(
+    filters: ContractFilters = Depends(stats_filters),
+    db_session: AsyncSession = Depends(get_async_db),
+):
+    """(User Story 3) Get total contract value and count grouped by award year; async variant."""
+    return await db_session.run_sync(fetch_value_by_year, filters)
+
+
+# Mount the read endpoints for the configured database mode. Included last so
+# that fixed paths declared on `app` (e.g. /contracts/export) take precedence
+# over /contracts/{contract_id}.
+app.include_router(async_read_router if DB_MODE == "async" else sync_read_router)
@@ -0,0 +1,32 @@
+"""
+Command-line maintenance tasks for the Convisoft database.
+
+Usage (from the app/ directory):
+    python manage.py rebuild-rollups
+"""
+import argparse
+
+from main import create_database_tables, engine, rebuild_rollups
+
+
+def cmd_rebuild_rollups(args):
+    """Recomputes the dashboard rollup tables from scratch in one transaction."""
+    with engine.begin() as conn:
+        rebuild_rollups(conn)
+    print("Rollup tables rebuilt.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convisoft database maintenance")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = subcommands.add_parser("rebuild-rollups", help="Recompute the stats_* rollup tables")
+    rebuild.set_defaults(func=cmd_rebuild_rollups)
+
+    args = parser.parse_args(argv)
+    create_database_tables()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
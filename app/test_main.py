@@ -149,4 +149,409 @@ def test_create_contract_zero_total_value(client):
 
 def test_get_non_existent_contract(client):
     response = client.get("/contracts/999999999")  # Assuming this contract doesn't exist
-    assert response.status_code == 404
\ No newline at end of file
+    assert response.status_code == 404
+# Pagination Tests
+
+def _create_company(client, legal_name="Paged Company"):
+    return client.post("/companies/", params={"legal_name": legal_name}).json()["company_id"]
+
+def _create_contract(client, company_id, contract_number, date_awarded, total_value=1000):
+    response = client.post("/contracts/", params={
+        "contract_number": contract_number,
+        "title": f"Contract {contract_number}",
+        "company_id": company_id,
+        "total_value": total_value,
+        "date_awarded": date_awarded,
+    })
+    assert response.status_code == 201
+    return response.json()["contract_id"]
+
+def test_list_contracts_keyset_pagination(client):
+    company_id = _create_company(client)
+    dates = ["2021-03-01", "2023-07-15", "2022-01-10", "2023-07-15", "2020-12-31"]
+    for i, awarded in enumerate(dates):
+        _create_contract(client, company_id, f"PAGE-{i}", awarded)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/contracts/", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        seen.extend(page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        assert 'rel="next"' in response.headers["Link"]
+
+    keys = [(c["date_awarded"], c["contract_id"]) for c in seen]
+    assert len(keys) == len(dates)
+    assert keys == sorted(keys, reverse=True)
+
+def test_list_contracts_last_page_has_no_cursor(client):
+    company_id = _create_company(client)
+    _create_contract(client, company_id, "ONLY-1", "2023-01-01")
+    response = client.get("/contracts/", params={"limit": 5})
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+
+def test_list_contracts_invalid_cursor(client):
+    response = client.get("/contracts/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+def test_list_contracts_limit_bounds(client):
+    assert client.get("/contracts/", params={"limit": 0}).status_code == 422
+    assert client.get("/contracts/", params={"limit": 100000}).status_code == 422
+
+# Filter & Sort Tests
+
+def _link_codes(db_session, contract_id, naics=(), psc=()):
+    from main import NaicsCodeModel, PscCodeModel, contract_naics_association, contract_psc_association
+    for code in naics:
+        if db_session.get(NaicsCodeModel, code) is None:
+            db_session.add(NaicsCodeModel(naics_code=code, description=f"NAICS {code}"))
+    for code in psc:
+        if db_session.get(PscCodeModel, code) is None:
+            db_session.add(PscCodeModel(psc_code=code, description=f"PSC {code}"))
+    db_session.flush()
+    for code in naics:
+        db_session.execute(contract_naics_association.insert().values(contract_id=contract_id, naics_code=code))
+    for code in psc:
+        db_session.execute(contract_psc_association.insert().values(contract_id=contract_id, psc_code=code))
+    db_session.commit()
+
+@pytest.fixture
+def filter_data(client, db_session):
+    acme = _create_company(client, "Acme")
+    globex = _create_company(client, "Globex")
+    ids = {
+        "a": _create_contract(client, acme, "F-A", "2021-05-01", 500),
+        "b": _create_contract(client, acme, "F-B", "2022-06-01", 2500),
+        "c": _create_contract(client, globex, "F-C", "2023-01-15", 10000),
+        "d": _create_contract(client, globex, "F-D", "2023-09-30", 750),
+    }
+    _link_codes(db_session, ids["a"], naics=["541511"], psc=["D302"])
+    _link_codes(db_session, ids["c"], naics=["541511", "541512"])
+    _link_codes(db_session, ids["d"], psc=["D302"])
+    return {"acme": acme, "globex": globex, **ids}
+
+def _numbers(response):
+    assert response.status_code == 200
+    return [c["contract_number"] for c in response.json()]
+
+def test_filter_contracts_by_date_range(client, filter_data):
+    response = client.get("/contracts/", params={"min_date": "2022-01-01", "max_date": "2023-06-30"})
+    assert _numbers(response) == ["F-C", "F-B"]
+
+def test_filter_contracts_by_value_range(client, filter_data):
+    response = client.get("/contracts/", params={"min_value": 600, "max_value": 5000})
+    assert _numbers(response) == ["F-D", "F-B"]
+
+def test_filter_contracts_by_company(client, filter_data):
+    response = client.get("/contracts/", params={"company_id": filter_data["acme"]})
+    assert _numbers(response) == ["F-B", "F-A"]
+
+def test_filter_contracts_by_codes(client, filter_data):
+    assert _numbers(client.get("/contracts/", params={"naics_code": "541511"})) == ["F-C", "F-A"]
+    assert _numbers(client.get("/contracts/", params={"psc_code": "D302"})) == ["F-D", "F-A"]
+    assert _numbers(client.get("/contracts/", params={"naics_code": "541511", "psc_code": "D302"})) == ["F-A"]
+
+def test_filter_contracts_no_match_returns_empty_list(client, filter_data):
+    assert _numbers(client.get("/contracts/", params={"naics_code": "999999"})) == []
+
+def test_sort_contracts_by_value_with_pagination(client, filter_data):
+    first = client.get("/contracts/", params={"sort": "-total_value", "limit": 2})
+    assert _numbers(first) == ["F-C", "F-B"]
+    second = client.get("/contracts/", params={"sort": "-total_value", "limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert _numbers(second) == ["F-D", "F-A"]
+    assert "X-Next-Cursor" not in second.headers
+
+    ascending = client.get("/contracts/", params={"sort": "total_value"})
+    assert _numbers(ascending) == ["F-A", "F-D", "F-B", "F-C"]
+
+def test_cursor_rejected_for_different_sort(client, filter_data):
+    first = client.get("/contracts/", params={"sort": "-total_value", "limit": 1})
+    response = client.get("/contracts/", params={"sort": "date_awarded", "cursor": first.headers["X-Next-Cursor"]})
+    assert response.status_code == 400
+
+def test_invalid_sort_key(client):
+    assert client.get("/contracts/", params={"sort": "title"}).status_code == 422
+
+# Expanded Contract Tests
+
+from contextlib import contextmanager
+from sqlalchemy import event
+
+@contextmanager
+def count_queries():
+    statements = []
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(test_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine, "before_cursor_execute", before_cursor_execute)
+
+def _add_location(db_session, city):
+    from main import LocationModel
+    location = LocationModel(address_line1="1 Main St", city=city, state_province="VA", postal_code="20190", country_code="US", latitude=38.9, longitude=-77.3)
+    db_session.add(location)
+    db_session.commit()
+    return location.location_id
+
+def _seed_expanded_contracts(client, db_session, count):
+    from main import CompanyModel, ContractModel
+    hq = _add_location(db_session, "Reston")
+    site = _add_location(db_session, "Huntsville")
+    for i in range(count):
+        company_id = _create_company(client, f"Expand Co {i}")
+        db_session.get(CompanyModel, company_id).primary_location_id = hq
+        contract_id = _create_contract(client, company_id, f"EXP-{i}", f"2023-01-{i + 1:02d}")
+        db_session.get(ContractModel, contract_id).place_of_performance_location_id = site
+        db_session.commit()
+        _link_codes(db_session, contract_id, naics=["541511", "541512"], psc=["D302"])
+    db_session.expire_all()
+
+def test_get_contract_detail(client, db_session):
+    _seed_expanded_contracts(client, db_session, 1)
+    contract_id = client.get("/contracts/").json()[0]["contract_id"]
+    response = client.get(f"/contracts/{contract_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["company"]["legal_name"] == "Expand Co 0"
+    assert data["company"]["primary_location"]["city"] == "Reston"
+    assert data["place_of_performance"]["city"] == "Huntsville"
+    assert sorted(n["naics_code"] for n in data["naics_codes"]) == ["541511", "541512"]
+    assert [p["psc_code"] for p in data["psc_codes"]] == ["D302"]
+
+def test_list_contracts_expand_unknown_value(client):
+    assert client.get("/contracts/", params={"expand": "company,owner"}).status_code == 400
+
+def test_list_contracts_expand_query_count_is_bounded(client, db_session):
+    _seed_expanded_contracts(client, db_session, 8)
+    params = {"expand": "company,location,codes"}
+
+    db_session.expire_all()
+    with count_queries() as small:
+        page = client.get("/contracts/", params={**params, "limit": 2}).json()
+    assert len(page) == 2
+
+    db_session.expire_all()
+    with count_queries() as large:
+        page = client.get("/contracts/", params={**params, "limit": 8}).json()
+    assert len(page) == 8
+    assert all(c["company"]["primary_location"]["city"] == "Reston" for c in page)
+    assert all(c["place_of_performance"]["city"] == "Huntsville" for c in page)
+    assert all(len(c["naics_codes"]) == 2 and len(c["psc_codes"]) == 1 for c in page)
+
+    # One query for the page plus one per code collection, independent of page size
+    assert len(large) == len(small)
+    assert len(large) <= 3
+
+# Export Tests
+
+import csv
+import io
+import json
+
+def test_export_contracts_csv(client, filter_data):
+    response = client.get("/contracts/export", params={"format": "csv", "company_id": filter_data["acme"]})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="contracts.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [r["contract_number"] for r in rows] == ["F-B", "F-A"]
+    assert rows[1]["company_name"] == "Acme"
+    assert rows[1]["naics_codes"] == "541511"
+    assert rows[1]["psc_codes"] == "D302"
+
+def test_export_contracts_ndjson(client, filter_data):
+    response = client.get("/contracts/export", params={"format": "ndjson", "naics_code": "541511", "sort": "total_value"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["contract_number"] for r in rows] == ["F-A", "F-C"]
+    assert rows[1]["total_value"] == 10000
+    assert sorted(rows[1]["naics_codes"].split(";")) == ["541511", "541512"]
+
+def test_export_contracts_empty_csv_has_header(client):
+    response = client.get("/contracts/export")
+    assert response.status_code == 200
+    assert response.text.splitlines()[0].startswith("contract_id,contract_number")
+
+def test_export_contracts_invalid_format(client):
+    assert client.get("/contracts/export", params={"format": "xlsx"}).status_code == 422
+
+# Stats Tests
+
+def test_top_companies(client, filter_data):
+    response = client.get("/stats/top-companies")
+    assert response.status_code == 200
+    data = response.json()
+    assert [row["company"]["legal_name"] for row in data] == ["Globex", "Acme"]
+    assert data[0]["total_contract_value"] == 10750
+    assert data[0]["contract_count"] == 2
+    assert data[1]["total_contract_value"] == 3000
+
+def test_top_companies_limit_and_filters(client, filter_data):
+    data = client.get("/stats/top-companies", params={"limit": 1, "psc_code": "D302"}).json()
+    assert len(data) == 1
+    assert data[0]["company"]["legal_name"] == "Globex"
+    assert data[0]["total_contract_value"] == 750
+
+    data = client.get("/stats/top-companies", params={"max_date": "2022-12-31"}).json()
+    assert [(row["company"]["legal_name"], row["contract_count"]) for row in data] == [("Acme", 2)]
+
+def test_value_by_year(client, filter_data):
+    response = client.get("/stats/value-by-year")
+    assert response.status_code == 200
+    assert response.json() == [
+        {"year": 2023, "total_value": 10750, "contract_count": 2},
+        {"year": 2022, "total_value": 2500, "contract_count": 1},
+        {"year": 2021, "total_value": 500, "contract_count": 1},
+    ]
+
+def test_value_by_year_naics_filter(client, filter_data):
+    data = client.get("/stats/value-by-year", params={"naics_code": "541511"}).json()
+    assert [(row["year"], row["total_value"]) for row in data] == [(2023, 10000), (2021, 500)]
+
+# Rollup Tests
+
+from sqlalchemy import text
+
+def _rollup_rows(db_session):
+    return {
+        table: sorted(tuple(row) for row in db_session.execute(text(f"SELECT * FROM {table}")))
+        for table in ("stats_company_year", "stats_naics_year", "stats_psc_year")
+    }
+
+def test_rollups_maintained_on_insert(client, db_session, filter_data):
+    rows = _rollup_rows(db_session)
+    assert rows["stats_company_year"] == [
+        (2021, filter_data["acme"], 500, 0, 1),
+        (2022, filter_data["acme"], 2500, 0, 1),
+        (2023, filter_data["globex"], 10750, 0, 2),
+    ]
+    assert rows["stats_naics_year"] == [
+        (2021, "541511", 500, 0, 1),
+        (2023, "541511", 10000, 0, 1),
+        (2023, "541512", 10000, 0, 1),
+    ]
+    assert rows["stats_psc_year"] == [(2021, "D302", 500, 0, 1), (2023, "D302", 750, 0, 1)]
+
+def test_rollups_follow_updates_and_deletes(client, db_session, filter_data):
+    from main import ContractModel, contract_naics_association, rebuild_rollups
+    contract = db_session.get(ContractModel, filter_data["c"])
+    contract.date_awarded = "2022-02-02"
+    contract.total_value = 4000
+    db_session.commit()
+    db_session.execute(contract_naics_association.delete().where(
+        (contract_naics_association.c.contract_id == filter_data["c"]) & (contract_naics_association.c.naics_code == "541512")
+    ))
+    db_session.delete(db_session.get(ContractModel, filter_data["a"]))
+    db_session.commit()
+
+    maintained = _rollup_rows(db_session)
+    rebuild_rollups(db_session.connection())
+    assert maintained == _rollup_rows(db_session)
+    assert maintained["stats_naics_year"] == [(2022, "541511", 4000, 0, 1)]
+    assert maintained["stats_psc_year"] == [(2023, "D302", 750, 0, 1)]
+
+def test_stats_served_from_rollups(client, filter_data):
+    with count_queries() as statements:
+        top = client.get("/stats/top-companies", params={"min_date": "2022-01-01", "max_date": "2023-12-31"}).json()
+        by_year = client.get("/stats/value-by-year", params={"naics_code": "541511"}).json()
+    assert not any("FROM contracts" in sql for sql in statements)
+    assert [(row["company"]["legal_name"], row["total_contract_value"]) for row in top] == [("Globex", 10750), ("Acme", 2500)]
+    assert [(row["year"], row["total_value"]) for row in by_year] == [(2023, 10000), (2021, 500)]
+
+def test_stats_fall_back_for_partial_year_bounds(client, filter_data):
+    data = client.get("/stats/value-by-year", params={"min_date": "2023-06-01"}).json()
+    assert data == [{"year": 2023, "total_value": 750, "contract_count": 1}]
+
+# Conditional GET Tests
+
+def test_read_endpoints_return_etag(client):
+    for path in ("/contracts/", "/companies/", "/locations/", "/stats/value-by-year"):
+        response = client.get(path)
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Cache-Control"] == "no-cache"
+
+def test_if_none_match_returns_304_without_querying(client):
+    etag = client.get("/companies/").headers["ETag"]
+    with count_queries() as statements:
+        response = client.get("/companies/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert statements == []
+
+def test_etag_depends_on_query_parameters(client):
+    first = client.get("/contracts/", params={"limit": 5, "sort": "total_value"}).headers["ETag"]
+    reordered = client.get("/contracts/?sort=total_value&limit=5").headers["ETag"]
+    other = client.get("/contracts/", params={"limit": 6, "sort": "total_value"}).headers["ETag"]
+    assert first == reordered
+    assert first != other
+
+def test_write_invalidates_etag(client):
+    etag = client.get("/companies/").headers["ETag"]
+    _create_company(client, "Fresh Co")
+    response = client.get("/companies/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [c["legal_name"] for c in response.json()] == ["Fresh Co"]
+
+def test_failed_write_keeps_etag(client):
+    etag = client.get("/companies/").headers["ETag"]
+    response = client.post("/contracts/", params={"contract_number": "X", "title": "X", "company_id": 424242, "total_value": 1, "date_awarded": "2023-01-01"})
+    assert response.status_code == 400
+    assert client.get("/companies/", headers={"If-None-Match": etag}).status_code == 304
+
+# Async Read Path Tests
+
+def test_async_read_endpoints_match_sync(client, filter_data, db_session, tmp_path):
+    pytest.importorskip("aiosqlite")
+    from fastapi import FastAPI
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from main import async_read_router, get_async_db
+
+    # Copy the populated in-memory database to a file the async driver can open
+    file_url = f"sqlite:///{tmp_path / 'async.db'}"
+    raw = db_session.connection().connection.driver_connection
+    target = create_engine(file_url)
+    with target.connect() as conn:
+        raw.backup(conn.connection.driver_connection)
+    target.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    AsyncTestSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncTestSession() as session:
+            yield session
+
+    async_app = FastAPI()
+    async_app.include_router(async_read_router)
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    paths = [
+        "/contracts/?sort=-total_value&limit=2&expand=company,codes",
+        f"/contracts/{filter_data['a']}",
+        "/companies/",
+        "/locations/",
+        "/stats/top-companies",
+        "/stats/value-by-year?naics_code=541511",
+    ]
+    with TestClient(async_app) as async_client:
+        for path in paths:
+            sync_response = client.get(path)
+            async_response = async_client.get(path)
+            assert async_response.status_code == 200
+            assert async_response.json() == sync_response.json()
+        page = async_client.get("/contracts/?limit=2")
+        assert page.headers["X-Next-Cursor"]
+        assert async_client.get("/contracts/999999").status_code == 404
@@ -121,13 +121,64 @@ CREATE TABLE contract_psc (                             -- contracts ⇄ PSC
 );
 
 --------------------------------------------------------------------
--- 6. Helpful Indexes for Query Performance
+-- 6. Dashboard Rollup Tables
+--------------------------------------------------------------------
+-- Per-year aggregates read by the /stats endpoints. They are maintained by
+-- triggers on contracts / contract_naics / contract_psc, which app/main.py
+-- installs on startup (rollup_triggers); rebuild with
+-- `python manage.py rebuild-rollups`.
+CREATE TABLE stats_company_year (
+    year              INTEGER NOT NULL,
+    company_id        INTEGER NOT NULL,
+    total_value       NUMERIC NOT NULL DEFAULT 0,
+    total_obligated   NUMERIC NOT NULL DEFAULT 0,
+    contract_count    INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (year, company_id)
+);
+
+CREATE TABLE stats_naics_year (
+    year              INTEGER NOT NULL,
+    naics_code        TEXT    NOT NULL,
+    total_value       NUMERIC NOT NULL DEFAULT 0,
+    total_obligated   NUMERIC NOT NULL DEFAULT 0,
+    contract_count    INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (year, naics_code)
+);
+
+CREATE TABLE stats_psc_year (
+    year              INTEGER NOT NULL,
+    psc_code          TEXT    NOT NULL,
+    total_value       NUMERIC NOT NULL DEFAULT 0,
+    total_obligated   NUMERIC NOT NULL DEFAULT 0,
+    contract_count    INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (year, psc_code)
+);
+
+--------------------------------------------------------------------
+-- 7. Helpful Indexes for Query Performance
 --------------------------------------------------------------------
 -- Frequently filtered columns
 CREATE INDEX idx_contracts_date_awarded      ON contracts(date_awarded);
 CREATE INDEX idx_contracts_total_value       ON contracts(total_value);
 CREATE INDEX idx_contracts_company_id        ON contracts(company_id);
 
+-- Keyset pagination / range filters per sort order (contract_id as tie-breaker)
+CREATE INDEX idx_contracts_date_awarded_id   ON contracts(date_awarded, contract_id);
+CREATE INDEX idx_contracts_total_value_id    ON contracts(total_value, contract_id);
+CREATE INDEX idx_contracts_company_date_id   ON contracts(company_id, date_awarded, contract_id);
+CREATE INDEX idx_contracts_company_value_id  ON contracts(company_id, total_value, contract_id);
+
+-- Covering index for date-filtered dashboard aggregates (/stats/*)
+CREATE INDEX idx_contracts_stats             ON contracts(date_awarded, company_id, total_value);
+
+-- Reverse junction indexes: "contracts with code X" (the PKs are contract-first)
+CREATE INDEX idx_contract_naics_code_contract ON contract_naics(naics_code, contract_id);
+CREATE INDEX idx_contract_psc_code_contract   ON contract_psc(psc_code, contract_id);
+
+-- Code-filtered yearly rollups
+CREATE INDEX idx_stats_naics_year_code       ON stats_naics_year(naics_code, year);
+CREATE INDEX idx_stats_psc_year_code         ON stats_psc_year(psc_code, year);
+
 -- Lookup indexes (text columns are PK but additional indexes help partial searches)
 CREATE INDEX idx_naics_description           ON naics_codes(description);
 CREATE INDEX idx_psc_description             ON psc_codes(description);